@@ -29,6 +29,7 @@ from hahomematic.const import (
     DEFAULT_ENCODING,
     DEFAULT_TLS,
     DEFAULT_VERIFY_TLS,
+    EVENT_PONG,
     FILE_DEVICES,
     FILE_PARAMSETS,
     HH_EVENT_DELETE_DEVICES,
@@ -47,13 +48,13 @@ from hahomematic.const import (
     OPERATION_EVENT,
     OPERATION_READ,
     PARAMSET_KEY_VALUES,
-    PROXY_INIT_SUCCESS,
     HmCallSource,
     HmDataOperationResult,
     HmEntityUsage,
     HmEventType,
     HmInterfaceEventType,
     HmPlatform,
+    HmProxyInitState,
 )
 from hahomematic.decorators import (
     callback_event,
@@ -359,7 +360,7 @@ class CentralUnit:
     async def _init_clients(self) -> None:
         """Init clients of control unit, and start connection checker."""
         for client in self._clients.values():
-            if PROXY_INIT_SUCCESS == await client.proxy_init():
+            if HmProxyInitState.INIT_SUCCESS == await client.proxy_init():
                 _LOGGER.debug("init_clients: client for %s initialized", client.interface_id)
 
     async def _de_init_clients(self) -> None:
@@ -468,14 +469,13 @@ class CentralUnit:
         self, platform: HmPlatform, existing_unique_ids: list[str] | None = None
     ) -> list[BaseEntity]:
         """Return all entities by platform. #CC."""
-        if not existing_unique_ids:
-            existing_unique_ids = []
+        existing_ids: set[str] = set(existing_unique_ids) if existing_unique_ids else set()
         entities = []
         for entity in self._entities.values():
             if (
-                entity.unique_identifier not in existing_unique_ids
+                entity.platform == platform
                 and entity.usage != HmEntityUsage.ENTITY_NO_CREATE
-                and entity.platform == platform
+                and entity.unique_identifier not in existing_ids
             ):
                 entities.append(entity)
 
@@ -505,20 +505,19 @@ class CentralUnit:
         self, platform: HmPlatform, existing_unique_ids: list[str] | None = None
     ) -> list[GenericHubEntity]:
         """Return the hub entities by platform. #CC."""
-        if not existing_unique_ids:
-            existing_unique_ids = []
+        existing_ids: set[str] = set(existing_unique_ids) if existing_unique_ids else set()
         hub_entities: list[GenericHubEntity] = []
         for program_entity in self.program_entities.values():
             if (
-                program_entity.unique_identifier not in existing_unique_ids
-                and program_entity.platform == platform
+                program_entity.platform == platform
+                and program_entity.unique_identifier not in existing_ids
             ):
                 hub_entities.append(program_entity)
 
         for sysvar_entity in self.sysvar_entities.values():
             if (
-                sysvar_entity.unique_identifier not in existing_unique_ids
-                and sysvar_entity.platform == platform
+                sysvar_entity.platform == platform
+                and sysvar_entity.unique_identifier not in existing_ids
             ):
                 hub_entities.append(sysvar_entity)
         return hub_entities
@@ -712,11 +711,11 @@ class CentralUnit:
 
         self.last_events[interface_id] = datetime.now()
         # No need to check the response of a XmlRPC-PING
-        if parameter == "PONG":
+        if parameter == EVENT_PONG:
             return
-        if (channel_address, parameter) in self._entity_event_subscriptions:
+        if callbacks := self._entity_event_subscriptions.get((channel_address, parameter)):
             try:
-                for callback in self._entity_event_subscriptions[(channel_address, parameter)]:
+                for callback in callbacks:
                     callback(value)
             except RuntimeError as rte:
                 _LOGGER.debug(
@@ -1309,7 +1308,7 @@ class BasePersistentCache(ABC):
         """Init the base class of the persistent cache."""
         self._central: Final[CentralUnit] = central
         self._cache_dir: Final[str] = f"{central.config.storage_folder}/cache"
-        self._filename: Final[str] = f"{central.name}_{filename}"
+        self._file_path: Final[str] = os.path.join(self._cache_dir, f"{central.name}_{filename}")
         self._persistant_cache: Final[dict[str, Any]] = persistant_cache
         self.last_save: datetime = INIT_DATETIME
 
@@ -1323,7 +1322,7 @@ class BasePersistentCache(ABC):
             self.last_save = datetime.now()
             if self._central.config.use_caches:
                 with open(
-                    file=os.path.join(self._cache_dir, self._filename),
+                    file=self._file_path,
                     mode="w",
                     encoding=DEFAULT_ENCODING,
                 ) as fptr:
@@ -1341,10 +1340,10 @@ class BasePersistentCache(ABC):
         def _load() -> HmDataOperationResult:
             if not check_or_create_directory(self._cache_dir):
                 return HmDataOperationResult.NO_LOAD
-            if not os.path.exists(os.path.join(self._cache_dir, self._filename)):
+            if not os.path.exists(self._file_path):
                 return HmDataOperationResult.NO_LOAD
             with open(
-                file=os.path.join(self._cache_dir, self._filename),
+                file=self._file_path,
                 encoding=DEFAULT_ENCODING,
             ) as fptr:
                 self._persistant_cache.clear()
@@ -1358,8 +1357,8 @@ class BasePersistentCache(ABC):
 
         def _clear() -> None:
             check_or_create_directory(self._cache_dir)
-            if os.path.exists(os.path.join(self._cache_dir, self._filename)):
-                os.unlink(os.path.join(self._cache_dir, self._filename))
+            if os.path.exists(self._file_path):
+                os.unlink(self._file_path)
             self._persistant_cache.clear()
 
         await self._central.async_add_executor_job(_clear)
@@ -1682,11 +1681,11 @@ class ParamsetDescriptionCache(BasePersistentCache):
 def cleanup_cache_dirs(instance_name: str, storage_folder: str) -> None:
     """Clean up the used cached directories."""
     cache_dir = f"{storage_folder}/cache"
-    files_to_delete = [FILE_DEVICES, FILE_PARAMSETS]
+    files_to_delete = (FILE_DEVICES, FILE_PARAMSETS)
 
     def _delete_file(file_name: str) -> None:
-        if os.path.exists(os.path.join(cache_dir, file_name)):
-            os.unlink(os.path.join(cache_dir, file_name))
+        if os.path.exists(file_path := os.path.join(cache_dir, file_name)):
+            os.unlink(file_path)
 
     for file_to_delete in files_to_delete:
         _delete_file(file_name=f"{instance_name}_{file_to_delete}")
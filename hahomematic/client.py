@@ -38,14 +38,10 @@ from hahomematic.const import (
     LOCAL_SERIAL,
     PARAMSET_KEY_MASTER,
     PARAMSET_KEY_VALUES,
-    PROXY_DE_INIT_FAILED,
-    PROXY_DE_INIT_SKIPPED,
-    PROXY_DE_INIT_SUCCESS,
-    PROXY_INIT_FAILED,
-    PROXY_INIT_SUCCESS,
     HmCallSource,
     HmForcedDeviceAvailability,
     HmInterfaceEventType,
+    HmProxyInitState,
 )
 from hahomematic.device import HmDevice
 from hahomematic.exceptions import AuthFailure, BaseHomematicException, NoConnection
@@ -93,7 +89,7 @@ class Client(ABC):
     def model(self) -> str:
         """Return the model of the backend."""
 
-    async def proxy_init(self) -> int:
+    async def proxy_init(self) -> HmProxyInitState:
         """Init the proxy has to tell the CCU / Homegear where to send the events."""
         try:
             _LOGGER.debug("proxy_init: init('%s', '%s')", self._config.init_url, self.interface_id)
@@ -110,18 +106,18 @@ class Client(ABC):
                 self.interface_id,
             )
             self.last_updated = INIT_DATETIME
-            return PROXY_INIT_FAILED
+            return HmProxyInitState.INIT_FAILED
         self.last_updated = datetime.now()
-        return PROXY_INIT_SUCCESS
+        return HmProxyInitState.INIT_SUCCESS
 
-    async def proxy_de_init(self) -> int:
+    async def proxy_de_init(self) -> HmProxyInitState:
         """De-init to stop CCU from sending events for this remote."""
         if self.last_updated == INIT_DATETIME:
             _LOGGER.debug(
                 "proxy_de_init: Skipping de-init for %s (not initialized)",
                 self.interface_id,
             )
-            return PROXY_DE_INIT_SKIPPED
+            return HmProxyInitState.DE_INIT_SKIPPED
         try:
             _LOGGER.debug("proxy_de_init: init('%s')", self._config.init_url)
             await self._proxy.init(self._config.init_url)
@@ -132,16 +128,16 @@ class Client(ABC):
                 hhe.args,
                 self.interface_id,
             )
-            return PROXY_DE_INIT_FAILED
+            return HmProxyInitState.DE_INIT_FAILED
 
         self.last_updated = INIT_DATETIME
-        return PROXY_DE_INIT_SUCCESS
+        return HmProxyInitState.DE_INIT_SUCCESS
 
-    async def proxy_re_init(self) -> int:
+    async def proxy_re_init(self) -> HmProxyInitState:
         """Reinit Proxy."""
-        if PROXY_DE_INIT_FAILED != await self.proxy_de_init():
+        if HmProxyInitState.DE_INIT_FAILED != await self.proxy_de_init():
             return await self.proxy_init()
-        return PROXY_DE_INIT_FAILED
+        return HmProxyInitState.DE_INIT_FAILED
 
     def _mark_all_devices_forced_availability(
         self, forced_availability: HmForcedDeviceAvailability
@@ -842,13 +838,13 @@ class ClientLocal(Client):  # pragma: no cover
         """Return the model of the backend."""
         return BACKEND_LOCAL
 
-    async def proxy_init(self) -> int:
+    async def proxy_init(self) -> HmProxyInitState:
         """Init the proxy has to tell the CCU / Homegear where to send the events."""
-        return PROXY_INIT_SUCCESS
+        return HmProxyInitState.INIT_SUCCESS
 
-    async def proxy_de_init(self) -> int:
+    async def proxy_de_init(self) -> HmProxyInitState:
         """De-init to stop CCU from sending events for this remote."""
-        return PROXY_DE_INIT_SUCCESS
+        return HmProxyInitState.DE_INIT_SUCCESS
 
     def stop(self) -> None:
         """Stop depending services."""
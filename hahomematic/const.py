@@ -29,7 +29,7 @@ BACKEND_CCU: Final = "CCU"
 BACKEND_HOMEGEAR: Final = "Homegear"
 BACKEND_LOCAL: Final = "Local CCU"
 BACKEND_PYDEVCCU: Final = "PyDevCCU"
-LOCAL_INTERFACE = "Local"
+LOCAL_INTERFACE: Final = "Local"
 LOCAL_SERIAL: Final = "0815_4711"
 
 PROGRAM_ADDRESS: Final = "program"
@@ -88,7 +88,7 @@ FLAG_VISIBLE: Final = 1
 FLAG_INTERAL: Final = 2
 FLAG_TRANSFORM: Final = 4  # not used
 FLAG_SERVICE: Final = 8
-FLAG_STICKY: Final = 10  # This might be wrong. Documentation says 0x10 # not used
+FLAG_STICKY: Final = 0x10  # not used
 
 HM_ARG_ON_TIME: Final = "on_time"
 
@@ -143,12 +143,6 @@ PROGRAM_ISINTERNAL: Final = "isInternal"
 PROGRAM_LASTEXECUTETIME: Final = "lastExecuteTime"
 PROGRAM_NAME: Final = "name"
 
-PROXY_INIT_FAILED: Final = 0
-PROXY_INIT_SUCCESS: Final = 1
-PROXY_DE_INIT_FAILED: Final = 4
-PROXY_DE_INIT_SUCCESS: Final = 8
-PROXY_DE_INIT_SKIPPED: Final = 16
-
 REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
 REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 REGA_SCRIPT_PATH: Final = "rega_scripts"
@@ -181,9 +175,11 @@ TYPE_FLOAT: Final = "FLOAT"
 TYPE_INTEGER: Final = "INTEGER"
 TYPE_STRING: Final = "STRING"
 
-CONFIGURABLE_CHANNEL: Final[tuple[str, ...]] = (
-    "KEY_TRANSCEIVER",
-    "MULTI_MODE_INPUT_TRANSMITTER",
+CONFIGURABLE_CHANNEL: Final[frozenset[str]] = frozenset(
+    {
+        "KEY_TRANSCEIVER",
+        "MULTI_MODE_INPUT_TRANSMITTER",
+    }
 )
 
 CHANNEL_OPERATION_MODE_VISIBILITY: Final[dict[str, tuple[str, ...]]] = {
@@ -194,20 +190,24 @@ CHANNEL_OPERATION_MODE_VISIBILITY: Final[dict[str, tuple[str, ...]]] = {
     EVENT_PRESS_SHORT: ("KEY_BEHAVIOR", "SWITCH_BEHAVIOR"),
 }
 
-CLICK_EVENTS: Final[tuple[str, ...]] = (
-    EVENT_PRESS,
-    EVENT_PRESS_CONT,
-    EVENT_PRESS_LONG,
-    EVENT_PRESS_LONG_RELEASE,
-    EVENT_PRESS_LONG_START,
-    EVENT_PRESS_SHORT,
+CLICK_EVENTS: Final[frozenset[str]] = frozenset(
+    {
+        EVENT_PRESS,
+        EVENT_PRESS_CONT,
+        EVENT_PRESS_LONG,
+        EVENT_PRESS_LONG_RELEASE,
+        EVENT_PRESS_LONG_START,
+        EVENT_PRESS_SHORT,
+    }
 )
 
 DEVICE_ERROR_EVENTS: Final[tuple[str, ...]] = ("ERROR", "SENSOR_ERROR")
 
-IMPULSE_EVENTS: Final[tuple[str, ...]] = (EVENT_SEQUENCE_OK,)
+IMPULSE_EVENTS: Final[frozenset[str]] = frozenset({EVENT_SEQUENCE_OK})
+
+UN_REACH_EVENTS: Final[frozenset[str]] = frozenset({EVENT_STICKY_UN_REACH, EVENT_UN_REACH})
 
-BUTTON_ACTIONS: Final[tuple[str, ...]] = ("RESET_MOTION", "RESET_PRESENCE")
+BUTTON_ACTIONS: Final[frozenset[str]] = frozenset({"RESET_MOTION", "RESET_PRESENCE"})
 
 
 FIX_UNIT_REPLACE: Final[dict[str, str]] = {
@@ -272,10 +272,12 @@ IF_DEFAULT_ALLOCATION: Final[dict[int, str]] = {
 
 NO_CACHE_ENTRY: Final = "NO_CACHE_ENTRY"
 
-RELEVANT_INIT_PARAMETERS: Final[tuple[str, ...]] = (
-    EVENT_CONFIG_PENDING,
-    EVENT_STICKY_UN_REACH,
-    EVENT_UN_REACH,
+RELEVANT_INIT_PARAMETERS: Final[frozenset[str]] = frozenset(
+    {
+        EVENT_CONFIG_PENDING,
+        EVENT_STICKY_UN_REACH,
+        EVENT_UN_REACH,
+    }
 )
 
 # virtual remotes device_types
@@ -291,10 +293,12 @@ HM_VIRTUAL_REMOTE_TYPES: Final[tuple[str, ...]] = (
 HM_VIRTUAL_REMOTE_HMIP_ADDRESS: Final = "HmIP-RCV-1"
 HM_VIRTUAL_REMOTE_HMW_ADDRESS: Final = "HMW-RCV-50"
 HM_VIRTUAL_REMOTE_HM_ADDRESS: Final = "BidCoS-RF"
-HM_VIRTUAL_REMOTE_ADDRESSES: Final[tuple[str, ...]] = (
-    HM_VIRTUAL_REMOTE_HMIP_ADDRESS,
-    HM_VIRTUAL_REMOTE_HMW_ADDRESS,
-    HM_VIRTUAL_REMOTE_HM_ADDRESS,
+HM_VIRTUAL_REMOTE_ADDRESSES: Final[frozenset[str]] = frozenset(
+    {
+        HM_VIRTUAL_REMOTE_HMIP_ADDRESS,
+        HM_VIRTUAL_REMOTE_HMW_ADDRESS,
+        HM_VIRTUAL_REMOTE_HM_ADDRESS,
+    }
 )
 
 # dict with binary_sensor relevant value lists and the corresponding TRUE value
@@ -316,6 +320,24 @@ class HmDataOperationResult(IntEnum):
     NO_SAVE: Final = 21
 
 
+class HmProxyInitState(IntEnum):
+    """Enum with proxy handling results."""
+
+    INIT_FAILED: Final = 0
+    INIT_SUCCESS: Final = 1
+    DE_INIT_FAILED: Final = 4
+    DE_INIT_SUCCESS: Final = 8
+    DE_INIT_SKIPPED: Final = 16
+
+
+# Deprecated aliases of HmProxyInitState
+PROXY_INIT_FAILED: Final = HmProxyInitState.INIT_FAILED
+PROXY_INIT_SUCCESS: Final = HmProxyInitState.INIT_SUCCESS
+PROXY_DE_INIT_FAILED: Final = HmProxyInitState.DE_INIT_FAILED
+PROXY_DE_INIT_SUCCESS: Final = HmProxyInitState.DE_INIT_SUCCESS
+PROXY_DE_INIT_SKIPPED: Final = HmProxyInitState.DE_INIT_SKIPPED
+
+
 class HmEntityUsage(StrEnum):
     """Enum with information about usage in Home Assistant."""
 
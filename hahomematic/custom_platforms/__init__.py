@@ -1,6 +1,9 @@
 """Here we provide access to the custom entity creation functions."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cache
+
 from hahomematic.custom_platforms import climate, cover, light, lock, siren, switch
 from hahomematic.custom_platforms.entity_definition import (
     ED_ADDITIONAL_ENTITIES,
@@ -14,13 +17,18 @@ from hahomematic.custom_platforms.entity_definition import (
 )
 from hahomematic.helpers import element_matches_key
 
-_ALL_DEVICES = (
-    cover.DEVICES,
-    climate.DEVICES,
-    light.DEVICES,
-    lock.DEVICES,
-    siren.DEVICES,
-    switch.DEVICES,
+# Keyed by the lower case device type, so lookups don't have to lower the keys.
+# The platform DEVICES are read-only mappings, so these copies can't get stale.
+_ALL_DEVICES: tuple[Mapping[str, CustomConfig | tuple[CustomConfig, ...]], ...] = tuple(
+    {d_type.lower(): custom_configs for d_type, custom_configs in platform_devices.items()}
+    for platform_devices in (
+        cover.DEVICES,
+        climate.DEVICES,
+        light.DEVICES,
+        lock.DEVICES,
+        siren.DEVICES,
+        switch.DEVICES,
+    )
 )
 
 _BLACKLISTED_DEVICES = (
@@ -35,16 +43,23 @@ _BLACKLISTED_DEVICES = (
 
 def get_entity_configs(
     device_type: str,
-) -> list[CustomConfig | tuple[CustomConfig, ...]]:
+) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
     """Return the entity configs to create custom entities."""
-    device_type = device_type.lower().replace("hb-", "hm-")
+    return _get_entity_configs(device_type.lower().replace("hb-", "hm-"))
+
+
+@cache
+def _get_entity_configs(
+    device_type: str,
+) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
+    """Return the entity configs for the normalized device_type."""
     funcs = []
     for platform_blacklisted_devices in _BLACKLISTED_DEVICES:
         if element_matches_key(
             search_elements=platform_blacklisted_devices,
             compare_with=device_type,
         ):
-            return []
+            return ()
 
     for platform_devices in _ALL_DEVICES:
         if func := _get_entity_config_by_platform(
@@ -52,20 +67,19 @@ def get_entity_configs(
             device_type=device_type,
         ):
             funcs.append(func)
-    return funcs
+    return tuple(funcs)
 
 
 def _get_entity_config_by_platform(
-    platform_devices: dict[str, CustomConfig | tuple[CustomConfig, ...]],
+    platform_devices: Mapping[str, CustomConfig | tuple[CustomConfig, ...]],
     device_type: str,
 ) -> CustomConfig | tuple[CustomConfig, ...] | None:
     """Return the entity configs to create custom entities."""
-    for d_type, custom_configs in platform_devices.items():
-        if device_type.lower() == d_type.lower():
-            return custom_configs
+    if custom_configs := platform_devices.get(device_type):
+        return custom_configs
 
     for d_type, custom_configs in platform_devices.items():
-        if device_type.lower().startswith(d_type.lower()):
+        if device_type.startswith(d_type):
             return custom_configs
 
     return None
@@ -89,6 +103,7 @@ def entity_definition_exists(device_type: str) -> bool:
     return len(get_entity_configs(device_type)) > 0
 
 
+@cache
 def get_required_parameters() -> tuple[str, ...]:
     """Return all required parameters for custom entities."""
     required_parameters: list[str] = []
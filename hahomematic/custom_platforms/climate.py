@@ -5,7 +5,9 @@ See https://www.home-assistant.io/integrations/climate/.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from hahomematic.backport import StrEnum
 from hahomematic.const import HmPlatform
@@ -623,24 +625,26 @@ def make_ip_thermostat_group(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "ALPHA-IP-RBG": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "BC-RT-TRX-CyG": CustomConfig(func=make_thermostat, channels=(1,)),
-    "BC-RT-TRX-CyN": CustomConfig(func=make_thermostat, channels=(1,)),
-    "BC-TC-C-WM": CustomConfig(func=make_thermostat, channels=(1,)),
-    "HM-CC-RT-DN": CustomConfig(func=make_thermostat, channels=(4,)),
-    "HM-CC-TC": CustomConfig(func=make_simple_thermostat, channels=(1,)),
-    "HM-CC-VG-1": CustomConfig(func=make_thermostat_group, channels=(1,)),
-    "HM-TC-IT-WM-W-EU": CustomConfig(func=make_thermostat, channels=(2,)),
-    "HmIP-BWTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "HmIP-HEATING": CustomConfig(func=make_ip_thermostat_group, channels=(1,)),
-    "HmIP-STH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "HmIP-WTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "HmIP-eTRV": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "HmIPW-STH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "HmIPW-WTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "Thermostat AA": CustomConfig(func=make_ip_thermostat, channels=(1,)),
-    "ZEL STG RM FWT": CustomConfig(func=make_simple_thermostat, channels=(1,)),
-}
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "ALPHA-IP-RBG": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "BC-RT-TRX-CyG": CustomConfig(func=make_thermostat, channels=(1,)),
+        "BC-RT-TRX-CyN": CustomConfig(func=make_thermostat, channels=(1,)),
+        "BC-TC-C-WM": CustomConfig(func=make_thermostat, channels=(1,)),
+        "HM-CC-RT-DN": CustomConfig(func=make_thermostat, channels=(4,)),
+        "HM-CC-TC": CustomConfig(func=make_simple_thermostat, channels=(1,)),
+        "HM-CC-VG-1": CustomConfig(func=make_thermostat_group, channels=(1,)),
+        "HM-TC-IT-WM-W-EU": CustomConfig(func=make_thermostat, channels=(2,)),
+        "HmIP-BWTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "HmIP-HEATING": CustomConfig(func=make_ip_thermostat_group, channels=(1,)),
+        "HmIP-STH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "HmIP-WTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "HmIP-eTRV": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "HmIPW-STH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "HmIPW-WTH": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "Thermostat AA": CustomConfig(func=make_ip_thermostat, channels=(1,)),
+        "ZEL STG RM FWT": CustomConfig(func=make_simple_thermostat, channels=(1,)),
+    }
+)
 
 BLACKLISTED_DEVICES: tuple[str, ...] = ("HmIP-STHO",)
@@ -5,6 +5,9 @@ See https://www.home-assistant.io/integrations/cover/.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from hahomematic.const import HmEntityUsage, HmPlatform
 from hahomematic.custom_platforms.entity_definition import (
     FIELD_CHANNEL_LEVEL,
@@ -436,62 +439,64 @@ def make_rf_window_drive(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "263 146": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "263 147": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1-FM-2": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1-PB-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1-SM": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1-SM-2": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Bl1PBU-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-BlX": CustomConfig(func=make_rf_cover, channels=(1,)),
-    "HM-LC-Ja1PBU-FM": CustomConfig(func=make_rf_blind, channels=(1,)),
-    "HM-LC-JaX": CustomConfig(func=make_rf_blind, channels=(1,)),
-    "HM-Sec-Win": CustomConfig(
-        func=make_rf_window_drive,
-        channels=(1,),
-        extended=ExtendedConfig(
-            additional_entities={
-                1: (
-                    "DIRECTION",
-                    "WORKING",
-                    "ERROR",
-                ),
-                2: (
-                    "LEVEL",
-                    "STATUS",
-                ),
-            }
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "263 146": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "263 147": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1-FM-2": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1-PB-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1-SM": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1-SM-2": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Bl1PBU-FM": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-BlX": CustomConfig(func=make_rf_cover, channels=(1,)),
+        "HM-LC-Ja1PBU-FM": CustomConfig(func=make_rf_blind, channels=(1,)),
+        "HM-LC-JaX": CustomConfig(func=make_rf_blind, channels=(1,)),
+        "HM-Sec-Win": CustomConfig(
+            func=make_rf_window_drive,
+            channels=(1,),
+            extended=ExtendedConfig(
+                additional_entities={
+                    1: (
+                        "DIRECTION",
+                        "WORKING",
+                        "ERROR",
+                    ),
+                    2: (
+                        "LEVEL",
+                        "STATUS",
+                    ),
+                }
+            ),
         ),
-    ),
-    "HMW-LC-Bl1": CustomConfig(func=make_rf_cover, channels=(3,)),
-    "HmIP-BBL": CustomConfig(func=make_ip_blind, channels=(3,)),
-    "HmIP-BROLL": CustomConfig(func=make_ip_cover, channels=(3,)),
-    "HmIP-DRBLI4": CustomConfig(
-        func=make_ip_blind,
-        channels=(9, 13, 17, 21),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HMW-LC-Bl1": CustomConfig(func=make_rf_cover, channels=(3,)),
+        "HmIP-BBL": CustomConfig(func=make_ip_blind, channels=(3,)),
+        "HmIP-BROLL": CustomConfig(func=make_ip_cover, channels=(3,)),
+        "HmIP-DRBLI4": CustomConfig(
+            func=make_ip_blind,
+            channels=(9, 13, 17, 21),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
         ),
-    ),
-    "HmIP-FBL": CustomConfig(func=make_ip_blind, channels=(3,)),
-    "HmIP-FROLL": CustomConfig(func=make_ip_cover, channels=(3,)),
-    "HmIP-HDM": CustomConfig(func=make_ip_blind, channels=(0,)),
-    "HmIP-MOD-HO": CustomConfig(func=make_ip_garage_ho, channels=(1,)),
-    "HmIP-MOD-TM": CustomConfig(func=make_ip_garage_tm, channels=(1,)),
-    "HmIPW-DRBL4": CustomConfig(
-        func=make_ip_blind,
-        channels=(1, 5, 9, 13),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HmIP-FBL": CustomConfig(func=make_ip_blind, channels=(3,)),
+        "HmIP-FROLL": CustomConfig(func=make_ip_cover, channels=(3,)),
+        "HmIP-HDM": CustomConfig(func=make_ip_blind, channels=(0,)),
+        "HmIP-MOD-HO": CustomConfig(func=make_ip_garage_ho, channels=(1,)),
+        "HmIP-MOD-TM": CustomConfig(func=make_ip_garage_tm, channels=(1,)),
+        "HmIPW-DRBL4": CustomConfig(
+            func=make_ip_blind,
+            channels=(1, 5, 9, 13),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
         ),
-    ),
-    "ZEL STG RM FEP 230V": CustomConfig(func=make_rf_cover, channels=(1,)),
-}
+        "ZEL STG RM FEP 230V": CustomConfig(func=make_rf_cover, channels=(1,)),
+    }
+)
 
 BLACKLISTED_DEVICES: tuple[str, ...] = ()
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import chain
 import logging
 from typing import Any
 
@@ -528,6 +529,7 @@ entity_definition: dict[str, dict[int | str | EntityDefinition, vol.Any]] = {
 }
 
 
+@cache
 def validate_entity_definition() -> Any:
     """Validate the entity_definition."""
     try:
@@ -552,13 +554,12 @@ def make_custom_entity(
     entities: list[hme.BaseEntity] = []
 
     entity_def = _get_device_entities(device_enum, group_base_channels[0])
+    device_address = device.device_address
 
     for base_channel in group_base_channels:
         device_def = _get_device_group(device_enum, base_channel)
-        channels = [device_def[ED_PRIMARY_CHANNEL]]
-        if secondary_channels := device_def.get(ED_SECONDARY_CHANNELS):
-            channels.extend(secondary_channels)
-        for channel_no in set(channels):
+        channels = (device_def[ED_PRIMARY_CHANNEL], *device_def[ED_SECONDARY_CHANNELS])
+        for channel_no in channels:
             entities.extend(
                 _create_entities(
                     device=device,
@@ -566,6 +567,7 @@ def make_custom_entity(
                     device_enum=device_enum,
                     device_def=device_def,
                     entity_def=entity_def,
+                    channel_address=f"{device_address}:{channel_no}",
                     channel_no=channel_no,
                     extended=extended,
                 )
@@ -580,19 +582,17 @@ def _create_entities(
     device_enum: EntityDefinition,
     device_def: dict[str, vol.Any],
     entity_def: dict[int, tuple[str, ...]],
+    channel_address: str,
     channel_no: int | None = None,
     extended: ExtendedConfig | None = None,
-) -> tuple[hme.BaseEntity, ...]:
+) -> list[hme.BaseEntity]:
     """Create custom entities."""
-    entities: list[hme.BaseEntity] = []
-    unique_identifier = generate_unique_identifier(
-        central=device.central, address=f"{device.device_address}:{channel_no}"
-    )
+    if channel_address not in device.channels:
+        return []
+    unique_identifier = generate_unique_identifier(central=device.central, address=channel_address)
     if device.central.has_entity(unique_identifier=unique_identifier):
         _LOGGER.debug("make_custom_entity: Skipping %s (already exists)", unique_identifier)
-        return tuple(entities)
-    if f"{device.device_address}:{channel_no}" not in device.channels:
-        return tuple(entities)
+        return []
     entity = custom_entity_class(
         device=device,
         unique_identifier=unique_identifier,
@@ -604,13 +604,13 @@ def _create_entities(
     )
     if len(entity.data_entities) > 0:
         device.add_entity(entity)
-        entities.append(entity)
-    return tuple(entities)
+        return [entity]
+    return []
 
 
 def get_default_entities() -> dict[int | tuple[int, ...], tuple[str, ...]]:
     """Return the default entities."""
-    return deepcopy(entity_definition[ED_DEFAULT_ENTITIES])  # type: ignore[arg-type]
+    return entity_definition[ED_DEFAULT_ENTITIES]  # type: ignore[return-value]
 
 
 def get_include_default_entities(device_enum: EntityDefinition) -> bool:
@@ -623,22 +623,24 @@ def get_include_default_entities(device_enum: EntityDefinition) -> bool:
 
 def _get_device(device_enum: EntityDefinition) -> dict[str, vol.Any] | None:
     """Return device from entity definitions."""
-    device = entity_definition[ED_DEVICE_DEFINITIONS].get(device_enum)
-    if device:
-        return deepcopy(device)  # type: ignore[no-any-return]
-    return None
+    return entity_definition[ED_DEVICE_DEFINITIONS].get(device_enum)
 
 
+@cache
 def _get_device_group(device_enum: EntityDefinition, base_channel_no: int) -> dict[str, vol.Any]:
-    """Return the device group."""
-    device = _get_device(device_enum)
-    group: dict[str, vol.Any] = {}
-    if device:
-        group = deepcopy(device[ED_DEVICE_GROUP])
-        if group and base_channel_no == 0:
-            return group
-        if not group:
-            return {}
+    """
+    Return the device group with all optional entries set.
+
+    The result is shared and must not be modified.
+    """
+    if not (device := _get_device(device_enum)) or not (
+        device_group := device.get(ED_DEVICE_GROUP)
+    ):
+        return {}
+
+    # The group is built once per base_channel_no. Only the channel related entries
+    # are rebased. All other entries are never modified, so they can be shared.
+    group: dict[str, vol.Any] = dict(device_group)
 
     # Add base_channel_no to the primary_channel to get the real primary_channel number
     primary_channel = group[ED_PRIMARY_CHANNEL]
@@ -646,8 +648,9 @@ def _get_device_group(device_enum: EntityDefinition, base_channel_no: int) -> di
 
     # Add base_channel_no to the secondary_channels
     # to get the real secondary_channel numbers
-    if secondary_channel := group.get(ED_SECONDARY_CHANNELS):
-        group[ED_SECONDARY_CHANNELS] = [x + base_channel_no for x in secondary_channel]
+    group[ED_SECONDARY_CHANNELS] = tuple(
+        x + base_channel_no for x in group.get(ED_SECONDARY_CHANNELS, ())
+    )
 
     group[ED_VISIBLE_FIELDS] = _rebase_entity_dict(
         entity_dict=ED_VISIBLE_FIELDS, group=group, base_channel_no=base_channel_no
@@ -655,6 +658,8 @@ def _get_device_group(device_enum: EntityDefinition, base_channel_no: int) -> di
     group[ED_FIELDS] = _rebase_entity_dict(
         entity_dict=ED_FIELDS, group=group, base_channel_no=base_channel_no
     )
+    group.setdefault(ED_REPEATABLE_FIELDS, {})
+    group.setdefault(ED_VISIBLE_REPEATABLE_FIELDS, {})
     return group
 
 
@@ -662,30 +667,31 @@ def _rebase_entity_dict(
     entity_dict: str, group: dict[str, vol.Any], base_channel_no: int
 ) -> dict[int, vol.Any]:
     """Rebase entity_dict with base_channel_no."""
-    new_fields = {}
-    if fields := group.get(entity_dict):
-        for channel_no, field in fields.items():
-            new_fields[channel_no + base_channel_no] = field
-    return new_fields
+    if not (fields := group.get(entity_dict)):
+        return {}
+    return {
+        channel_no + base_channel_no: channel_fields
+        for channel_no, channel_fields in fields.items()
+    }
 
 
+@cache
 def _get_device_entities(
     device_enum: EntityDefinition, base_channel_no: int
 ) -> dict[int, tuple[str, ...]]:
-    """Return the device entities."""
+    """Return the device entities. The result is shared and must not be modified."""
     additional_entities = (
         entity_definition[ED_DEVICE_DEFINITIONS]
         .get(device_enum, {})
         .get(ED_ADDITIONAL_ENTITIES, {})
     )
-    new_entities: dict[int, tuple[str, ...]] = {}
-    if additional_entities:
-        for channel_no, field in deepcopy(additional_entities).items():
-            new_entities[channel_no + base_channel_no] = field
-    return new_entities
+    return {
+        channel_no + base_channel_no: parameters
+        for channel_no, parameters in additional_entities.items()
+    }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CustomConfig:
     """Data for custom entity creation."""
 
@@ -694,23 +700,25 @@ class CustomConfig:
     extended: ExtendedConfig | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtendedConfig:
     """Extended data for custom entity creation."""
 
     fixed_channels: dict[int, dict[str, str]] | None = None
     additional_entities: dict[int | tuple[int, ...], tuple[str, ...]] | None = None
-
-    @property
-    def required_parameters(self) -> tuple[str, ...]:
-        """Return vol.Required parameters from extended config."""
-        required_parameters: list[str] = []
-        if fixed_channels := self.fixed_channels:
-            for mapping in fixed_channels.values():
-                required_parameters.extend(mapping.values())
-
-        if additional_entities := self.additional_entities:
-            for parameters in additional_entities.values():
-                required_parameters.extend(parameters)
-
-        return tuple(required_parameters)
+    required_parameters: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Collect the vol.Required parameters from extended config."""
+        fixed_channels = self.fixed_channels or {}
+        additional_entities = self.additional_entities or {}
+        object.__setattr__(
+            self,
+            "required_parameters",
+            tuple(
+                chain(
+                    chain.from_iterable(mapping.values() for mapping in fixed_channels.values()),
+                    chain.from_iterable(additional_entities.values()),
+                )
+            ),
+        )
@@ -6,7 +6,10 @@ See https://www.home-assistant.io/integrations/light/.
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, cast
+from bisect import bisect_left
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
 
 from hahomematic.const import HM_ARG_ON_TIME, HmPlatform
 from hahomematic.custom_platforms.entity_definition import (
@@ -54,6 +57,11 @@ HM_DIMMER_OFF: float = 0.0
 TIME_UNIT_SECONDS = 0
 TIME_UNIT_MINUTES = 1
 TIME_UNIT_HOURS = 2
+_MAX_TIME_VALUE: Final = 16343
+
+# Upper hue bounds (inclusive) of the colors supported by CeIpFixedColorLight.
+_HUE_BOUNDARIES: Final = (30, 90, 150, 210, 270, 330)
+_HUE_COLORS: Final = ("RED", "YELLOW", "GREEN", "TURQUOISE", "BLUE", "PURPLE", "RED")
 
 
 class BaseHmLight(CustomEntity):
@@ -123,7 +131,7 @@ class BaseHmLight(CustomEntity):
         return None
 
     @value_property
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> tuple[str, ...] | None:
         """Return the list of supported effects."""
         return None
 
@@ -131,30 +139,29 @@ class BaseHmLight(CustomEntity):
     async def turn_on(
         self,
         collector: CallParameterCollector | None = None,
-        **kwargs: dict[str, Any] | None,
+        **kwargs: Any,
     ) -> None:
         """Turn the light on."""
         if HM_ARG_RAMP_TIME in kwargs:
-            ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
+            ramp_time = float(kwargs[HM_ARG_RAMP_TIME])
             await self.set_ramp_time_value(ramp_time=ramp_time, collector=collector)
         if HM_ARG_ON_TIME in kwargs:
-            on_time = float(cast(float, kwargs[HM_ARG_ON_TIME]))
+            on_time = float(kwargs[HM_ARG_ON_TIME])
             await self.set_on_time_value(on_time=on_time, collector=collector)
+        current_brightness = self.brightness
         if (
-            (brightness := cast(int, (kwargs.get(HM_ARG_BRIGHTNESS, self.brightness)) or 255))
-            and brightness != self.brightness
-            or kwargs
-        ):
+            brightness := kwargs.get(HM_ARG_BRIGHTNESS, current_brightness) or 255
+        ) != current_brightness or kwargs:
             level = brightness / 255.0
             await self._e_level.send_value(value=level, collector=collector)
 
     @bind_collector
     async def turn_off(
-        self, collector: CallParameterCollector | None = None, **kwargs: dict[str, Any] | None
+        self, collector: CallParameterCollector | None = None, **kwargs: Any
     ) -> None:
         """Turn the light off."""
         if HM_ARG_RAMP_TIME in kwargs:
-            ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
+            ramp_time = float(kwargs[HM_ARG_RAMP_TIME])
             await self.set_ramp_time_value(ramp_time=ramp_time, collector=collector)
 
         await self._e_level.send_value(value=HM_DIMMER_OFF, collector=collector)
@@ -254,7 +261,7 @@ class CeColorDimmer(CeDimmer):
 class CeColorDimmerEffect(CeColorDimmer):
     """Class for HomeMatic dimmer with color entities."""
 
-    _effect_list: list[str] = [
+    _effect_list: tuple[str, ...] = (
         HM_EFFECT_OFF,
         "Slow color change",
         "Medium color change",
@@ -262,7 +269,8 @@ class CeColorDimmerEffect(CeColorDimmer):
         "Campfire",
         "Waterfall",
         "TV simulation",
-    ]
+    )
+    _effect_index: dict[str, int] = {effect: idx for idx, effect in enumerate(_effect_list)}
 
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
@@ -284,7 +292,7 @@ class CeColorDimmerEffect(CeColorDimmer):
         return None
 
     @value_property
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> tuple[str, ...] | None:
         """Return the list of supported effects."""
         return self._effect_list
 
@@ -293,13 +301,13 @@ class CeColorDimmerEffect(CeColorDimmer):
         self, collector: CallParameterCollector | None = None, **kwargs: Any
     ) -> None:
         """Turn the light on."""
-        if HM_ARG_HS_COLOR in kwargs and self.supports_effects and self.effect != HM_EFFECT_OFF:
+        supports_effects = self.supports_effects
+        if HM_ARG_HS_COLOR in kwargs and supports_effects and self.effect != HM_EFFECT_OFF:
             await self._e_effect.send_value(value=0, collector=collector)
 
-        if self.supports_effects and HM_ARG_EFFECT in kwargs:
+        if supports_effects and HM_ARG_EFFECT in kwargs:
             effect = str(kwargs[HM_ARG_EFFECT])
-            effect_idx = self._effect_list.index(effect)
-            if effect_idx is not None:
+            if (effect_idx := self._effect_index.get(effect)) is not None:
                 await self._e_effect.send_value(value=effect_idx, collector=collector)
 
         await super().turn_on(collector=collector, **kwargs)
@@ -402,15 +410,15 @@ class CeIpFixedColorLight(BaseHmLight):
     @value_property
     def hs_color(self) -> tuple[float, float] | None:
         """Return the hue and saturation color value [float, float]."""
-        if self._e_color.value is not None:
-            return self._color_switcher.get(self._e_color.value, (0.0, 0.0))
+        if (color := self._e_color.value) is not None:
+            return self._color_switcher.get(color, (0.0, 0.0))
         return 0.0, 0.0
 
     @property
     def channel_hs_color(self) -> tuple[float, float] | None:
         """Return the channel hue and saturation color value [float, float]."""
-        if self._e_channel_color.value is not None:
-            return self._color_switcher.get(self._e_channel_color.value, (0.0, 0.0))
+        if (channel_color := self._e_channel_color.value) is not None:
+            return self._color_switcher.get(channel_color, (0.0, 0.0))
         return None
 
     @value_property
@@ -435,13 +443,7 @@ class CeIpFixedColorLight(BaseHmLight):
         self, on_time: float, collector: CallParameterCollector | None = None
     ) -> None:
         """Set the on time value in seconds."""
-        on_time_unit = TIME_UNIT_SECONDS
-        if on_time > 16343:
-            on_time /= 60
-            on_time_unit = TIME_UNIT_MINUTES
-        if on_time > 16343:
-            on_time /= 60
-            on_time_unit = TIME_UNIT_HOURS
+        on_time, on_time_unit = _recalc_unit_timer(time=on_time)
 
         await self._e_on_time_unit.send_value(value=on_time_unit, collector=collector)
         await self._e_on_time_value.send_value(value=float(on_time), collector=collector)
@@ -451,18 +453,21 @@ class CeIpFixedColorLight(BaseHmLight):
         self, ramp_time: float, collector: CallParameterCollector | None = None
     ) -> None:
         """Set the ramp time value in seconds."""
-        ramp_time_unit = TIME_UNIT_SECONDS
-        if ramp_time > 16343:
-            ramp_time /= 60
-            ramp_time_unit = TIME_UNIT_MINUTES
-        if ramp_time > 16343:
-            ramp_time /= 60
-            ramp_time_unit = TIME_UNIT_HOURS
+        ramp_time, ramp_time_unit = _recalc_unit_timer(time=ramp_time)
 
         await self._e_ramp_time_unit.send_value(value=ramp_time_unit, collector=collector)
         await self._e_ramp_time_value.send_value(value=float(ramp_time), collector=collector)
 
 
+def _recalc_unit_timer(time: float) -> tuple[float, int]:
+    """Return the time value and the unit that keeps it in the accepted range."""
+    if time <= _MAX_TIME_VALUE:
+        return time, TIME_UNIT_SECONDS
+    if (time := time / 60) <= _MAX_TIME_VALUE:
+        return time, TIME_UNIT_MINUTES
+    return time / 60, TIME_UNIT_HOURS
+
+
 def _convert_color(color: tuple[float, float] | None) -> str:
     """
     Convert the given color to the reduced color of the device.
@@ -477,17 +482,7 @@ def _convert_color(color: tuple[float, float] | None) -> str:
     saturation: int = int(color[1])
     if saturation < 5:
         return "WHITE"
-    if 30 < hue <= 90:
-        return "YELLOW"
-    if 90 < hue <= 150:
-        return "GREEN"
-    if 150 < hue <= 210:
-        return "TURQUOISE"
-    if 210 < hue <= 270:
-        return "BLUE"
-    if 270 < hue <= 330:
-        return "PURPLE"
-    return "RED"
+    return _HUE_COLORS[bisect_left(_HUE_BOUNDARIES, hue)]
 
 
 def make_ip_dimmer(
@@ -611,103 +606,105 @@ def make_ip_simple_fixed_color_light(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "263 132": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "263 133": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "263 134": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "HBW-LC-RGBWW-IN6-DR": (
-        CustomConfig(
-            func=make_rf_dimmer,
-            channels=(7, 8),
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "263 132": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "263 133": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "263 134": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "HBW-LC-RGBWW-IN6-DR": (
+            CustomConfig(
+                func=make_rf_dimmer,
+                channels=(7, 8),
+                extended=ExtendedConfig(
+                    additional_entities={
+                        (1, 2, 3, 4, 5, 6,): (
+                            "PRESS_LONG",
+                            "PRESS_SHORT",
+                            "SENSOR",
+                        )
+                    },
+                ),
+            ),
+            CustomConfig(
+                func=make_rf_dimmer_color,
+                channels=(9, 10, 11),
+                extended=ExtendedConfig(fixed_channels={15: {FIELD_COLOR: "COLOR"}}),
+            ),
+            CustomConfig(
+                func=make_rf_dimmer_color,
+                channels=(12, 13, 14),
+                extended=ExtendedConfig(fixed_channels={16: {FIELD_COLOR: "COLOR"}}),
+            ),
+        ),
+        "HM-DW-WM": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4)),
+        "HM-LC-AO-SM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-DW-WM": CustomConfig(func=make_rf_dimmer_color_temp, channels=(1, 3, 5)),
+        "HM-LC-Dim1L-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1L-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1L-Pl": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1L-Pl-2": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "HM-LC-Dim1L-Pl-3": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1PWM-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1PWM-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-DR": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3)),
+        "HM-LC-Dim1T-FM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-FM-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-FM-LF": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "HM-LC-Dim1T-Pl": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1T-Pl-2": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "HM-LC-Dim1T-Pl-3": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1TPBU-FM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim1TPBU-FM-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
+        "HM-LC-Dim2L-CV": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
+        "HM-LC-Dim2L-SM": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
+        "HM-LC-Dim2L-SM-2": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
+        "HM-LC-Dim2T-SM": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
+        "HM-LC-Dim2T-SM-2": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
+        "HM-LC-RGBW-WM": CustomConfig(func=make_rf_dimmer_color_effect, channels=(1,)),
+        "HMW-LC-Dim1L-DR": CustomConfig(func=make_rf_dimmer, channels=(3,)),
+        "HSS-DX": CustomConfig(func=make_rf_dimmer, channels=(1,)),
+        "HmIP-BDT": CustomConfig(func=make_ip_dimmer, channels=(3,)),
+        "HmIP-BSL": CustomConfig(func=make_ip_fixed_color_light, channels=(7, 11)),
+        "HmIP-DRDI3": CustomConfig(
+            func=make_ip_dimmer,
+            channels=(4, 8, 12),
             extended=ExtendedConfig(
                 additional_entities={
-                    (1, 2, 3, 4, 5, 6,): (
-                        "PRESS_LONG",
-                        "PRESS_SHORT",
-                        "SENSOR",
-                    )
-                },
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
             ),
         ),
-        CustomConfig(
-            func=make_rf_dimmer_color,
-            channels=(9, 10, 11),
-            extended=ExtendedConfig(fixed_channels={15: {FIELD_COLOR: "COLOR"}}),
-        ),
-        CustomConfig(
-            func=make_rf_dimmer_color,
-            channels=(12, 13, 14),
-            extended=ExtendedConfig(fixed_channels={16: {FIELD_COLOR: "COLOR"}}),
-        ),
-    ),
-    "HM-DW-WM": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4)),
-    "HM-LC-AO-SM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-DW-WM": CustomConfig(func=make_rf_dimmer_color_temp, channels=(1, 3, 5)),
-    "HM-LC-Dim1L-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1L-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1L-Pl": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1L-Pl-2": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "HM-LC-Dim1L-Pl-3": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1PWM-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1PWM-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-CV": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-CV-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-DR": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3)),
-    "HM-LC-Dim1T-FM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-FM-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-FM-LF": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "HM-LC-Dim1T-Pl": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1T-Pl-2": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "HM-LC-Dim1T-Pl-3": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1TPBU-FM": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim1TPBU-FM-2": CustomConfig(func=make_rf_dimmer_with_virt_channel, channels=(1,)),
-    "HM-LC-Dim2L-CV": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
-    "HM-LC-Dim2L-SM": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
-    "HM-LC-Dim2L-SM-2": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
-    "HM-LC-Dim2T-SM": CustomConfig(func=make_rf_dimmer, channels=(1, 2)),
-    "HM-LC-Dim2T-SM-2": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
-    "HM-LC-RGBW-WM": CustomConfig(func=make_rf_dimmer_color_effect, channels=(1,)),
-    "HMW-LC-Dim1L-DR": CustomConfig(func=make_rf_dimmer, channels=(3,)),
-    "HSS-DX": CustomConfig(func=make_rf_dimmer, channels=(1,)),
-    "HmIP-BDT": CustomConfig(func=make_ip_dimmer, channels=(3,)),
-    "HmIP-BSL": CustomConfig(func=make_ip_fixed_color_light, channels=(7, 11)),
-    "HmIP-DRDI3": CustomConfig(
-        func=make_ip_dimmer,
-        channels=(4, 8, 12),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HmIP-FDT": CustomConfig(func=make_ip_dimmer, channels=(1,)),
+        "HmIP-PDT": CustomConfig(func=make_ip_dimmer, channels=(2,)),
+        "HmIP-SCTH230": CustomConfig(
+            func=make_ip_dimmer,
+            channels=(11,),
+            extended=ExtendedConfig(
+                additional_entities={
+                    1: ("CONCENTRATION",),
+                    4: (
+                        "HUMIDITY",
+                        "ACTUAL_TEMPERATURE",
+                    ),
+                }
+            ),
         ),
-    ),
-    "HmIP-FDT": CustomConfig(func=make_ip_dimmer, channels=(1,)),
-    "HmIP-PDT": CustomConfig(func=make_ip_dimmer, channels=(2,)),
-    "HmIP-SCTH230": CustomConfig(
-        func=make_ip_dimmer,
-        channels=(11,),
-        extended=ExtendedConfig(
-            additional_entities={
-                1: ("CONCENTRATION",),
-                4: (
-                    "HUMIDITY",
-                    "ACTUAL_TEMPERATURE",
-                ),
-            }
+        "HmIPW-DRD3": CustomConfig(
+            func=make_ip_dimmer,
+            channels=(1, 5, 9),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
         ),
-    ),
-    "HmIPW-DRD3": CustomConfig(
-        func=make_ip_dimmer,
-        channels=(1, 5, 9),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HmIPW-WRC6": CustomConfig(
+            func=make_ip_simple_fixed_color_light, channels=(7, 8, 9, 10, 11, 12)
         ),
-    ),
-    "HmIPW-WRC6": CustomConfig(
-        func=make_ip_simple_fixed_color_light, channels=(7, 8, 9, 10, 11, 12)
-    ),
-    "OLIGO.smart.iq.HM": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
-}
+        "OLIGO.smart.iq.HM": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
+    }
+)
 
 BLACKLISTED_DEVICES: tuple[str, ...] = ()
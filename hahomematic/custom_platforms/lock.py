@@ -6,6 +6,8 @@ See https://www.home-assistant.io/integrations/lock/.
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from hahomematic.const import HmPlatform
 from hahomematic.custom_platforms.entity_definition import (
@@ -46,6 +48,13 @@ class BaseLock(CustomEntity):
 
     _attr_platform = HmPlatform.LOCK
 
+    def _init_entity_fields(self) -> None:
+        """Init the entity fields."""
+        super()._init_entity_fields()
+        self._e_direction: HmSensor = self._get_entity(
+            field_name=FIELD_DIRECTION, entity_type=HmSensor
+        )
+
     @value_property
     @abstractmethod
     def is_locked(self) -> bool:
@@ -57,14 +66,21 @@ class BaseLock(CustomEntity):
         """Return true if lock is jammed."""
 
     @value_property
-    @abstractmethod
     def is_locking(self) -> bool | None:
         """Return true if the lock is locking."""
+        return self._direction_is(HM_LOCKING)
 
     @value_property
-    @abstractmethod
     def is_unlocking(self) -> bool | None:
         """Return true if the lock is unlocking."""
+        return self._direction_is(HM_UNLOCKING)
+
+    def _direction_is(self, direction: str) -> bool | None:
+        """Return true if the lock moves in the given direction."""
+        current_direction: str | None = self._e_direction.value
+        if current_direction is not None:
+            return current_direction == direction
+        return None
 
     @abstractmethod
     async def lock(self) -> None:
@@ -91,29 +107,12 @@ class CeIpLock(BaseLock):
         self._e_lock_target_level: HmAction = self._get_entity(
             field_name=FIELD_LOCK_TARGET_LEVEL, entity_type=HmAction
         )
-        self._e_direction: HmSensor = self._get_entity(
-            field_name=FIELD_DIRECTION, entity_type=HmSensor
-        )
 
     @value_property
     def is_locked(self) -> bool:
         """Return true if lock is on."""
         return self._e_lock_state.value == LOCK_STATE_LOCKED
 
-    @value_property
-    def is_locking(self) -> bool | None:
-        """Return true if the lock is locking."""
-        if self._e_direction.value is not None:
-            return str(self._e_direction.value) == HM_LOCKING
-        return None
-
-    @value_property
-    def is_unlocking(self) -> bool | None:
-        """Return true if the lock is unlocking."""
-        if self._e_direction.value is not None:
-            return str(self._e_direction.value) == HM_UNLOCKING
-        return None
-
     @value_property
     def is_jammed(self) -> bool:
         """Return true if lock is jammed."""
@@ -140,9 +139,6 @@ class CeRfLock(BaseLock):
         super()._init_entity_fields()
         self._e_state: HmSwitch = self._get_entity(field_name=FIELD_STATE, entity_type=HmSwitch)
         self._e_open: HmAction = self._get_entity(field_name=FIELD_OPEN, entity_type=HmAction)
-        self._e_direction: HmSensor = self._get_entity(
-            field_name=FIELD_DIRECTION, entity_type=HmSensor
-        )
         self._e_error: HmSensor = self._get_entity(field_name=FIELD_ERROR, entity_type=HmSensor)
 
     @value_property
@@ -150,20 +146,6 @@ class CeRfLock(BaseLock):
         """Return true if lock is on."""
         return self._e_state.value is not True
 
-    @value_property
-    def is_locking(self) -> bool | None:
-        """Return true if the lock is locking."""
-        if self._e_direction.value is not None:
-            return str(self._e_direction.value) == HM_LOCKING
-        return None
-
-    @value_property
-    def is_unlocking(self) -> bool | None:
-        """Return true if the lock is unlocking."""
-        if self._e_direction.value is not None:
-            return str(self._e_direction.value) == HM_UNLOCKING
-        return None
-
     @value_property
     def is_jammed(self) -> bool:
         """Return true if lock is jammed."""
@@ -213,28 +195,30 @@ def make_rf_lock(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "HM-Sec-Key": CustomConfig(
-        func=make_rf_lock,
-        channels=(1,),
-        extended=ExtendedConfig(
-            additional_entities={
-                1: (
-                    "DIRECTION",
-                    "ERROR",
-                ),
-            }
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "HM-Sec-Key": CustomConfig(
+            func=make_rf_lock,
+            channels=(1,),
+            extended=ExtendedConfig(
+                additional_entities={
+                    1: (
+                        "DIRECTION",
+                        "ERROR",
+                    ),
+                }
+            ),
         ),
-    ),
-    "HmIP-DLD": CustomConfig(
-        func=make_ip_lock,
-        channels=(0,),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ERROR_JAMMED",),
-            }
+        "HmIP-DLD": CustomConfig(
+            func=make_ip_lock,
+            channels=(0,),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ERROR_JAMMED",),
+                }
+            ),
         ),
-    ),
-}
+    }
+)
 
 BLACKLISTED_DEVICES: tuple[str, ...] = ()
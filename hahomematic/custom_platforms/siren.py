@@ -6,6 +6,8 @@ See https://www.home-assistant.io/integrations/siren/.
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from hahomematic.const import HmPlatform
 from hahomematic.custom_platforms.entity_definition import (
@@ -187,8 +189,10 @@ def make_rf_siren(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "HmIP-ASIR": CustomConfig(func=make_ip_siren, channels=(0,)),
-}
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "HmIP-ASIR": CustomConfig(func=make_ip_siren, channels=(0,)),
+    }
+)
 
 BLACKLISTED_DEVICES: tuple[str, ...] = ()
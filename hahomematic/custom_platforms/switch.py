@@ -5,6 +5,8 @@ See https://www.home-assistant.io/integrations/switch/.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, cast
 
 from hahomematic.const import HM_ARG_ON_TIME, HmPlatform
@@ -105,53 +107,57 @@ def make_rf_switch(
 
 
 # Case for device model is not relevant
-DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
-    "ELV-SH-BS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
-    "HmIP-BS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
-    "HmIP-BSL": CustomConfig(func=make_ip_switch, channels=(3,)),
-    "HmIP-BSM": CustomConfig(func=make_ip_switch, channels=(3,)),
-    "HmIP-DRSI1": CustomConfig(
-        func=make_ip_switch,
-        channels=(2,),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+DEVICES: Mapping[str, CustomConfig | tuple[CustomConfig, ...]] = MappingProxyType(
+    {
+        "ELV-SH-BS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
+        "HmIP-BS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
+        "HmIP-BSL": CustomConfig(func=make_ip_switch, channels=(3,)),
+        "HmIP-BSM": CustomConfig(func=make_ip_switch, channels=(3,)),
+        "HmIP-DRSI1": CustomConfig(
+            func=make_ip_switch,
+            channels=(2,),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
         ),
-    ),
-    "HmIP-DRSI4": CustomConfig(
-        func=make_ip_switch,
-        channels=(5, 9, 13, 17),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HmIP-DRSI4": CustomConfig(
+            func=make_ip_switch,
+            channels=(5, 9, 13, 17),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
         ),
-    ),
-    "HmIP-FSI": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-FSM": CustomConfig(func=make_ip_switch, channels=(1,)),
-    "HmIP-MOD-OC8": CustomConfig(func=make_ip_switch, channels=(9, 13, 17, 21, 25, 29, 33, 37)),
-    "HmIP-PCBS": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-PCBS-BAT": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-PCBS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
-    "HmIP-PS": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-SCTH230": CustomConfig(func=make_ip_switch, channels=(7,)),
-    "HmIP-USBSM": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-WGC": CustomConfig(func=make_ip_switch, channels=(2,)),
-    "HmIP-WHS2": CustomConfig(func=make_ip_switch, channels=(1, 5)),
-    "HmIPW-DRS": CustomConfig(
-        func=make_ip_switch,
-        channels=(1, 5, 9, 13, 17, 21, 25, 29),
-        extended=ExtendedConfig(
-            additional_entities={
-                0: ("ACTUAL_TEMPERATURE",),
-            }
+        "HmIP-FSI": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-FSM": CustomConfig(func=make_ip_switch, channels=(1,)),
+        "HmIP-MOD-OC8": CustomConfig(
+            func=make_ip_switch, channels=(9, 13, 17, 21, 25, 29, 33, 37)
         ),
-    ),
-    "HmIPW-FIO6": CustomConfig(func=make_ip_switch, channels=(7, 11, 15, 19, 23, 27)),
-    # "HM-LC-Sw": CustomEntityConfig(make_rf_switch, group_base_channels=(1, 2, 3, 4)),
-    # "HM-ES-PM": CustomEntityConfig(make_rf_switch, group_base_channels=(1,))),
-}
+        "HmIP-PCBS": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-PCBS-BAT": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-PCBS2": CustomConfig(func=make_ip_switch, channels=(3, 7)),
+        "HmIP-PS": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-SCTH230": CustomConfig(func=make_ip_switch, channels=(7,)),
+        "HmIP-USBSM": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-WGC": CustomConfig(func=make_ip_switch, channels=(2,)),
+        "HmIP-WHS2": CustomConfig(func=make_ip_switch, channels=(1, 5)),
+        "HmIPW-DRS": CustomConfig(
+            func=make_ip_switch,
+            channels=(1, 5, 9, 13, 17, 21, 25, 29),
+            extended=ExtendedConfig(
+                additional_entities={
+                    0: ("ACTUAL_TEMPERATURE",),
+                }
+            ),
+        ),
+        "HmIPW-FIO6": CustomConfig(func=make_ip_switch, channels=(7, 11, 15, 19, 23, 27)),
+        # "HM-LC-Sw": CustomEntityConfig(make_rf_switch, group_base_channels=(1, 2, 3, 4)),
+        # "HM-ES-PM": CustomEntityConfig(make_rf_switch, group_base_channels=(1,))),
+    }
+)
 
 # Devices are better supported without custom entities:
 # HmIP-MIO16-PCB : Don't add it. Too much functionality.
@@ -78,6 +78,15 @@ import hahomematic.support as hm_support
 
 _LOGGER = logging.getLogger(__name__)
 
+# generic entity types for writable, readable parameters by their type
+_WRITABLE_ENTITY_TYPES: Final[dict[str, type[GenericEntity]]] = {
+    TYPE_BOOL: HmSwitch,
+    TYPE_ENUM: HmSelect,
+    TYPE_FLOAT: HmFloat,
+    TYPE_INTEGER: HmInteger,
+    TYPE_STRING: HmText,
+}
+
 
 class HmDevice:
     """Object to hold information about a device and associated entities."""
@@ -402,7 +411,8 @@ class HmDevice:
                             parameter=parameter,
                         )
                     )
-                    if parameter_data[HM_OPERATIONS] & OPERATION_EVENT and (
+                    operations: int = parameter_data[HM_OPERATIONS]
+                    if operations & OPERATION_EVENT and (
                         parameter in CLICK_EVENTS
                         or parameter.startswith(DEVICE_ERROR_EVENTS)
                         or parameter in IMPULSE_EVENTS
@@ -412,10 +422,7 @@ class HmDevice:
                             parameter=parameter,
                             parameter_data=parameter_data,
                         )
-                    if (
-                        not parameter_data[HM_OPERATIONS] & OPERATION_EVENT
-                        and not parameter_data[HM_OPERATIONS] & OPERATION_WRITE
-                    ) or (
+                    if not operations & (OPERATION_EVENT | OPERATION_WRITE) or (
                         parameter_data[HM_FLAGS] & FLAG_INTERAL
                         and parameter not in ALLOWED_INTERNAL_PARAMETERS
                         and not parameter_is_un_ignored
@@ -543,16 +550,8 @@ class HmDevice:
             else:
                 if parameter_data[HM_OPERATIONS] == OPERATION_WRITE:
                     entity_t = HmAction
-                elif parameter_data[HM_TYPE] == TYPE_BOOL:
-                    entity_t = HmSwitch
-                elif parameter_data[HM_TYPE] == TYPE_ENUM:
-                    entity_t = HmSelect
-                elif parameter_data[HM_TYPE] == TYPE_FLOAT:
-                    entity_t = HmFloat
-                elif parameter_data[HM_TYPE] == TYPE_INTEGER:
-                    entity_t = HmInteger
-                elif parameter_data[HM_TYPE] == TYPE_STRING:
-                    entity_t = HmText
+                else:
+                    entity_t = _WRITABLE_ENTITY_TYPES.get(parameter_data[HM_TYPE])
         else:
             if parameter not in CLICK_EVENTS:
                 # Also check, if sensor could be a binary_sensor due to value_list.
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime
 import logging
+import sys
 from typing import Any, Final, Generic, TypeVar, cast
 
 from slugify import slugify
@@ -22,8 +23,6 @@ from hahomematic.const import (
     CHANNEL_OPERATION_MODE_VISIBILITY,
     CONFIGURABLE_CHANNEL,
     EVENT_CONFIG_PENDING,
-    EVENT_STICKY_UN_REACH,
-    EVENT_UN_REACH,
     FIX_UNIT_BY_PARAM,
     FIX_UNIT_REPLACE,
     FLAG_SERVICE,
@@ -47,6 +46,7 @@ from hahomematic.const import (
     PARAMSET_KEY_VALUES,
     SYSVAR_ADDRESS,
     TYPE_BOOL,
+    UN_REACH_EVENTS,
     HmCallSource,
     HmEntityUsage,
     HmEventType,
@@ -68,6 +68,7 @@ from hahomematic.helpers import (
     get_device_channel,
     get_entity_name,
     get_event_name,
+    get_value_index,
     parse_sys_var,
     updated_within_seconds,
 )
@@ -283,7 +284,7 @@ class BaseParameterEntity(Generic[ParameterT], BaseEntity):
         """Initialize the entity."""
         self._attr_paramset_key: Final[str] = paramset_key
         # required for name in BaseEntity
-        self._attr_parameter: Final[str] = parameter
+        self._attr_parameter: Final[str] = sys.intern(parameter)
         super().__init__(
             device=device,
             unique_identifier=unique_identifier,
@@ -300,14 +301,17 @@ class BaseParameterEntity(Generic[ParameterT], BaseEntity):
         self._attr_value_list: tuple[str, ...] | None = None
         if HM_VALUE_LIST in parameter_data:
             self._attr_value_list = tuple(parameter_data[HM_VALUE_LIST])
+        self._value_index: Mapping[str, int] = get_value_index(
+            value_list=self._attr_value_list or ()
+        )
         self._attr_max: ParameterT = self._convert_value(parameter_data[HM_MAX])
         self._attr_min: ParameterT = self._convert_value(parameter_data[HM_MIN])
         self._attr_default: ParameterT = self._convert_value(
             parameter_data.get(HM_DEFAULT, self._attr_min)
         )
         flags: int = parameter_data[HM_FLAGS]
-        self._attr_visible: bool = flags & FLAG_VISIBLE == FLAG_VISIBLE
-        self._attr_service: bool = flags & FLAG_SERVICE == FLAG_SERVICE
+        self._attr_visible: bool = bool(flags & FLAG_VISIBLE)
+        self._attr_service: bool = bool(flags & FLAG_SERVICE)
         self._attr_operations: int = parameter_data[HM_OPERATIONS]
         self._attr_special: dict[str, Any] | None = parameter_data.get(HM_SPECIAL)
         self._attr_raw_unit: str | None = parameter_data.get(HM_UNIT)
@@ -561,10 +565,7 @@ class GenericEntity(BaseParameterEntity[ParameterT]):
             self._central.create_task(self.device.reload_paramset_descriptions())
 
         # send device availability events
-        if self._attr_parameter in (
-            EVENT_UN_REACH,
-            EVENT_STICKY_UN_REACH,
-        ):
+        if self._attr_parameter in UN_REACH_EVENTS:
             self.device.update_device(self._attr_unique_identifier)
 
             if callable(self._central.callback_ha_event):
@@ -742,9 +743,7 @@ class CustomEntity(BaseEntity):
 
     def _get_entity_usage(self) -> HmEntityUsage:
         """Generate the usage for the entity."""
-        if (
-            secondary_channels := self._device_desc.get(hmed.ED_SECONDARY_CHANNELS)
-        ) and self.channel_no in secondary_channels:
+        if self.channel_no in self._device_desc[hmed.ED_SECONDARY_CHANNELS]:
             return HmEntityUsage.CE_SECONDARY
         return HmEntityUsage.CE_PRIMARY
 
@@ -762,18 +761,16 @@ class CustomEntity(BaseEntity):
     def _init_entities(self) -> None:
         """init entity collection."""
         # Add repeating fields
-        for (field_name, parameter) in self._device_desc.get(
-            hmed.ED_REPEATABLE_FIELDS, {}
-        ).items():
+        for (field_name, parameter) in self._device_desc[hmed.ED_REPEATABLE_FIELDS].items():
             entity = self.device.get_generic_entity(
                 channel_address=self._attr_channel_address, parameter=parameter
             )
             self._add_entity(field_name=field_name, entity=entity)
 
         # Add visible repeating fields
-        for (field_name, parameter) in self._device_desc.get(
-            hmed.ED_VISIBLE_REPEATABLE_FIELDS, {}
-        ).items():
+        for (field_name, parameter) in self._device_desc[
+            hmed.ED_VISIBLE_REPEATABLE_FIELDS
+        ].items():
             entity = self.device.get_generic_entity(
                 channel_address=self._attr_channel_address, parameter=parameter
             )
@@ -816,8 +813,7 @@ class CustomEntity(BaseEntity):
 
     def _add_entities(self, field_dict_name: str, is_visible: bool = False) -> None:
         """Add entities to custom entity."""
-        fields = self._device_desc.get(field_dict_name, {})
-        for channel_no, channel in fields.items():
+        for channel_no, channel in self._device_desc[field_dict_name].items():
             for (field_name, parameter) in channel.items():
                 channel_address = f"{self.device.device_address}:{channel_no}"
                 if entity := self.device.get_generic_entity(
@@ -942,6 +938,9 @@ class GenericSystemVariable(GenericHubEntity):
         self._attr_value_list: Final[tuple[str, ...] | None] = (
             tuple(data.value_list) if data.value_list else None
         )
+        self._value_index: Final[Mapping[str, int]] = get_value_index(
+            value_list=self._attr_value_list or ()
+        )
         self._attr_max: Final[float | int | None] = data.max_value
         self._attr_min: Final[float | int | None] = data.min_value
         self._attr_unit: Final[str | None] = data.unit
@@ -1130,25 +1129,36 @@ class NoneTypeEntity:
 class CallParameterCollector:
     """Create a Paramset based on given generic entities."""
 
-    def __init__(self, custom_entity: CustomEntity) -> None:
-        """Init the generator."""
-        self._custom_entity = custom_entity
+    def __init__(self, custom_entity: BaseEntity) -> None:
+        """
+        Init the generator.
+
+        custom_entity is the entity that sends the paramset. This can be a custom
+        or a generic entity; the keyword is kept for compatibility.
+        """
+        self._entity: Final[BaseEntity] = custom_entity
         self._paramsets: dict[str, dict[str, Any]] = {}
 
     def add_entity(self, entity: GenericEntity, value: Any) -> None:
         """Add a generic entity."""
-        # if entity.channel_address != self._custom_entity.channel_address:
+        # if entity.channel_address != self._entity.channel_address:
         #    raise HaHomematicException(
-        #        f"add_entity: Mismatch in channel_address for {self._custom_entity.full_name}"
+        #        f"add_entity: Mismatch in channel_address for {self._entity.full_name}"
         #    )
-        if entity.channel_address not in self._paramsets:
-            self._paramsets[entity.channel_address] = {}
-        self._paramsets[entity.channel_address][entity.parameter] = value
+        self.add_parameter(
+            channel_address=entity.channel_address, parameter=entity.parameter, value=value
+        )
+
+    def add_parameter(self, channel_address: str, parameter: str, value: Any) -> None:
+        """Add a parameter that has no entity of its own."""
+        if channel_address not in self._paramsets:
+            self._paramsets[channel_address] = {}
+        self._paramsets[channel_address][parameter] = value
 
     async def put_paramset(self) -> bool:
         """Send paramset to backend."""
         for channel_address, paramset in self._paramsets.items():
-            if not await self._custom_entity.device.client.put_paramset(
+            if not await self._entity.device.client.put_paramset(
                 address=channel_address, paramset_key=PARAMSET_KEY_VALUES, value=paramset
             ):
                 return False
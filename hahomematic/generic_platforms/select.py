@@ -42,11 +42,8 @@ class HmSelect(GenericEntity[int | str]):
         if isinstance(value, int) and self._attr_value_list:
             if 0 <= value < len(self._attr_value_list):
                 await super().send_value(value=value, collector=collector)
-        elif self._attr_value_list:
-            if value in self._attr_value_list:
-                await super().send_value(
-                    value=self._attr_value_list.index(value), collector=collector
-                )
+        elif (value_index := self._value_index.get(str(value))) is not None:
+            await super().send_value(value=value_index, collector=collector)
         else:
             _LOGGER.warning(
                 "Value not in value_list for %s/%s.",
@@ -74,9 +71,8 @@ class HmSysvarSelect(GenericSystemVariable):
         if isinstance(value, int) and self._attr_value_list:
             if 0 <= value < len(self._attr_value_list):
                 await super().send_variable(value)
-        elif self._attr_value_list:
-            if value in self._attr_value_list:
-                await super().send_variable(self._attr_value_list.index(value))
+        elif (value_index := self._value_index.get(str(value))) is not None:
+            await super().send_variable(value_index)
         else:
             _LOGGER.warning(
                 "Value not in value_list for %s/%s.",
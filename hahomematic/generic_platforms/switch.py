@@ -5,9 +5,14 @@ See https://www.home-assistant.io/integrations/switch/.
 """
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any
 
-from hahomematic.const import HM_ARG_ON_TIME, TYPE_ACTION, HmPlatform
+from hahomematic.const import (
+    HM_ARG_ON_TIME,
+    PARAMSET_KEY_VALUES,
+    TYPE_ACTION,
+    HmPlatform,
+)
 from hahomematic.decorators import value_property
 from hahomematic.entity import (
     CallParameterCollector,
@@ -35,20 +40,56 @@ class HmSwitch(GenericEntity[bool]):
         return self._attr_value
 
     async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: dict[str, Any] | None
+        self, collector: CallParameterCollector | None = None, **kwargs: Any
     ) -> None:
         """Turn the switch on."""
-        if HM_ARG_ON_TIME in kwargs:
-            on_time = float(cast(float, kwargs[HM_ARG_ON_TIME]))
-            await self.set_on_time_value(on_time=on_time)
+        if (on_time := kwargs.get(HM_ARG_ON_TIME)) is None:
+            await self.send_value(value=True, collector=collector)
+            return
+
+        if self._attr_paramset_key != PARAMSET_KEY_VALUES or not self._has_on_time_parameter():
+            # A paramset with an unknown ON_TIME would be rejected as a whole.
+            await self.set_on_time_value(on_time=float(on_time))
+            await self.send_value(value=True, collector=collector)
+            return
+
+        own_collector: CallParameterCollector | None = None
+        if collector is None:
+            # Send ON_TIME and STATE with a single putParamset.
+            collector = own_collector = CallParameterCollector(custom_entity=self)
+        await self.set_on_time_value(on_time=float(on_time), collector=collector)
         await self.send_value(value=True, collector=collector)
+        if own_collector is not None:
+            await own_collector.put_paramset()
+
+    def _has_on_time_parameter(self) -> bool:
+        """Return if the channel of the switch has an ON_TIME parameter."""
+        return (
+            self._central.paramset_descriptions.get_parameter_data(
+                interface_id=self.device.interface_id,
+                channel_address=self._attr_channel_address,
+                paramset_key=PARAMSET_KEY_VALUES,
+                parameter=PARAM_ON_TIME,
+            )
+            is not None
+        )
 
     async def turn_off(self, collector: CallParameterCollector | None = None) -> None:
         """Turn the switch off."""
         await self.send_value(value=False, collector=collector)
 
-    async def set_on_time_value(self, on_time: float) -> None:
+    async def set_on_time_value(
+        self, on_time: float, collector: CallParameterCollector | None = None
+    ) -> None:
         """Set the on time value in seconds."""
+        if collector:
+            collector.add_parameter(
+                channel_address=self._attr_channel_address,
+                parameter=PARAM_ON_TIME,
+                value=float(on_time),
+            )
+            return
+
         await self._client.set_value(
             channel_address=self._attr_channel_address,
             paramset_key=self._attr_paramset_key,
@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import base64
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 import logging
 import os
 import socket
 import ssl
+from types import MappingProxyType
 from typing import Any
 
 import hahomematic.central_unit as hmcu
@@ -370,6 +372,20 @@ def convert_value(value: Any, target_type: str, value_list: tuple[str, ...] | No
     return value
 
 
+@cache
+def get_value_index(value_list: tuple[str, ...]) -> Mapping[str, int]:
+    """
+    Return the index of each value in a value_list.
+
+    Many entities share the same value_list, so they also share the returned
+    read-only mapping.
+    """
+    value_index: dict[str, int] = {}
+    for idx, value in enumerate(value_list):
+        value_index.setdefault(value, idx)
+    return MappingProxyType(value_index)
+
+
 def is_binary_sensor(parameter_data: dict[str, Any]) -> bool:
     """Check, if the sensor is a binary_sensor."""
     if parameter_data[HM_TYPE] == TYPE_BOOL:
@@ -111,7 +111,7 @@ class HmHub:
 
         # remove some variables in case of CCU Backend
         # - OldValue(s) are for internal calculations
-        if self._central.model is BACKEND_CCU:
+        if self._central.model == BACKEND_CCU:
             variables = _clean_variables(variables)
 
         missing_variable_names = self._identify_missing_variable_names(variables=variables)
@@ -11,6 +11,7 @@ import ssl
 from typing import Any, Final
 
 from aiohttp import ClientConnectorError, ClientError, ClientSession
+from yarl import URL
 
 from hahomematic import config
 import hahomematic.central_unit as hmcu
@@ -81,7 +82,7 @@ class JsonRpcAioHttpClient:
         self._password: Final[str] = password
         self._tls: Final[bool] = tls
         self._tls_context: Final[ssl.SSLContext] = get_tls_context(verify_tls)
-        self._url: Final[str] = f"{device_url}{PATH_JSON_RPC}"
+        self._url: Final[URL] = URL(f"{device_url}{PATH_JSON_RPC}")
         self._script_cache: dict[str, str] = {}
 
     @property
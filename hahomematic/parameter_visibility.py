@@ -62,101 +62,104 @@ _RELEVANT_MASTER_PARAMSETS_BY_DEVICE: Final[dict[str, tuple[tuple[int, ...], tup
     "HmIPW-WTH": ((1,), (PARAM_TEMPERATURE_MAXIMUM, PARAM_TEMPERATURE_MINIMUM)),
 }
 
-ALLOWED_INTERNAL_PARAMETERS: Final = ("DIRECTION",)
-
-_HIDDEN_PARAMETERS: Final[tuple[str, ...]] = (
-    EVENT_CONFIG_PENDING,
-    EVENT_ERROR,
-    EVENT_STICKY_UN_REACH,
-    EVENT_UN_REACH,
-    EVENT_UPDATE_PENDING,
-    PARAM_CHANNEL_OPERATION_MODE,
-    PARAM_TEMPERATURE_MAXIMUM,
-    PARAM_TEMPERATURE_MINIMUM,
-    "ACTIVITY_STATE",
-    "DIRECTION",
-    "SECTION",
-    "WORKING",
+ALLOWED_INTERNAL_PARAMETERS: Final[frozenset[str]] = frozenset({"DIRECTION"})
+
+_HIDDEN_PARAMETERS: Final[frozenset[str]] = frozenset(
+    {
+        EVENT_CONFIG_PENDING,
+        EVENT_ERROR,
+        EVENT_STICKY_UN_REACH,
+        EVENT_UN_REACH,
+        EVENT_UPDATE_PENDING,
+        PARAM_CHANNEL_OPERATION_MODE,
+        PARAM_TEMPERATURE_MAXIMUM,
+        PARAM_TEMPERATURE_MINIMUM,
+        "ACTIVITY_STATE",
+        "DIRECTION",
+        "SECTION",
+        "WORKING",
+    }
 )
 
 # Parameters within the VALUES paramset for which we don't create entities.
-_IGNORED_PARAMETERS: Final[tuple[str, ...]] = (
-    "ACCESS_AUTHORIZATION",
-    "ACOUSTIC_NOTIFICATION_SELECTION",  # ro
-    "ADAPTION_DRIVE",  # ro"
-    "AES_KEY",
-    "ALARM_COUNT",  # ro"
-    "ALL_LEDS",  # ro"
-    "ARROW_DOWN",  # ro"
-    "ARROW_UP",  # ro
-    "BACKLIGHT",  # ro
-    "BEEP",  # ro"
-    "BELL",  # ro"
-    "BLIND",  # ro"
-    "BOOST_STATE",
-    "BOOST_TIME",
-    "BOOT",
-    "BULB",  # ro"
-    "CLEAR_WINDOW_OPEN_SYMBOL",  # ro
-    "CLOCK",  # ro"
-    "COMBINED_PARAMETER",  # ro
-    "CONTROL_DIFFERENTIAL_TEMPERATURE",
-    "DATE_TIME_UNKNOWN",
-    "DECISION_VALUE",
-    "DEVICE_IN_BOOTLOADER",
-    "DISPLAY_DATA_ALIGNMENT",  # ro
-    "DISPLAY_DATA_BACKGROUND_COLOR",  # ro
-    "DISPLAY_DATA_COMMIT",  # ro
-    "DISPLAY_DATA_ICON",  # ro
-    "DISPLAY_DATA_ID",  # ro
-    "DISPLAY_DATA_ID",  # ro
-    "DISPLAY_DATA_STRING",  # ro
-    "DISPLAY_DATA_TEXT_COLOR",  # ro
-    "DOOR",  # ro"
-    "EXTERNAL_CLOCK",
-    "FROST_PROTECTION",
-    "HUMIDITY_LIMITER",
-    "IDENTIFICATION_MODE_KEY_VISUAL",
-    "IDENTIFICATION_MODE_LCD_BACKLIGHT",
-    "INCLUSION_UNSUPPORTED_DEVICE",
-    "INHIBIT",
-    "INSTALL_MODE",
-    "INTERVAL",  # ro
-    "LEVEL_COMBINED",  # ro
-    "LEVEL_REAL",
-    "OLD_LEVEL",  # ro
-    "OVERFLOW",
-    "OVERRUN",
-    "PARTY_SET_POINT_TEMPERATURE",
-    "PARTY_TEMPERATURE",
-    "PARTY_TIME_END",
-    "PARTY_TIME_START",
-    "PHONE",  # ro"
-    "PROCESS",
-    "QUICK_VETO_TIME",
-    "RAMP_STOP",
-    "RELOCK_DELAY",
-    "SCENE",  # ro"
-    "SELF_CALIBRATION",
-    "SERVICE_COUNT",  # ro"
-    "SET_SYMBOL_FOR_HEATING_PHASE",
-    "SHADING_SPEED",  # ro
-    "SHEV_POS",  # ro"
-    "SMOKE_DETECTOR_COMMAND",  # ro
-    "SPEED",  # ro"
-    "STATE_UNCERTAIN",
-    "SUBMIT",
-    "SWITCH_POINT_OCCURED",
-    "TEMPERATURE_LIMITER",
-    "TEMPERATURE_OUT_OF_RANGE",
-    "TEXT",
-    "TIME_OF_OPERATION",
-    "USER_COLOR",  # ro"
-    "USER_PROGRAM",  # ro"
-    "VALVE_ADAPTION",
-    "WINDOW",  # ro
-    "WIN_RELEASE",
-    "WIN_RELEASE_ACT",  # ro"
+_IGNORED_PARAMETERS: Final[frozenset[str]] = frozenset(
+    {
+        "ACCESS_AUTHORIZATION",
+        "ACOUSTIC_NOTIFICATION_SELECTION",  # ro
+        "ADAPTION_DRIVE",  # ro"
+        "AES_KEY",
+        "ALARM_COUNT",  # ro"
+        "ALL_LEDS",  # ro"
+        "ARROW_DOWN",  # ro"
+        "ARROW_UP",  # ro
+        "BACKLIGHT",  # ro
+        "BEEP",  # ro"
+        "BELL",  # ro"
+        "BLIND",  # ro"
+        "BOOST_STATE",
+        "BOOST_TIME",
+        "BOOT",
+        "BULB",  # ro"
+        "CLEAR_WINDOW_OPEN_SYMBOL",  # ro
+        "CLOCK",  # ro"
+        "COMBINED_PARAMETER",  # ro
+        "CONTROL_DIFFERENTIAL_TEMPERATURE",
+        "DATE_TIME_UNKNOWN",
+        "DECISION_VALUE",
+        "DEVICE_IN_BOOTLOADER",
+        "DISPLAY_DATA_ALIGNMENT",  # ro
+        "DISPLAY_DATA_BACKGROUND_COLOR",  # ro
+        "DISPLAY_DATA_COMMIT",  # ro
+        "DISPLAY_DATA_ICON",  # ro
+        "DISPLAY_DATA_ID",  # ro
+        "DISPLAY_DATA_STRING",  # ro
+        "DISPLAY_DATA_TEXT_COLOR",  # ro
+        "DOOR",  # ro"
+        "EXTERNAL_CLOCK",
+        "FROST_PROTECTION",
+        "HUMIDITY_LIMITER",
+        "IDENTIFICATION_MODE_KEY_VISUAL",
+        "IDENTIFICATION_MODE_LCD_BACKLIGHT",
+        "INCLUSION_UNSUPPORTED_DEVICE",
+        "INHIBIT",
+        "INSTALL_MODE",
+        "INTERVAL",  # ro
+        "LEVEL_COMBINED",  # ro
+        "LEVEL_REAL",
+        "OLD_LEVEL",  # ro
+        "OVERFLOW",
+        "OVERRUN",
+        "PARTY_SET_POINT_TEMPERATURE",
+        "PARTY_TEMPERATURE",
+        "PARTY_TIME_END",
+        "PARTY_TIME_START",
+        "PHONE",  # ro"
+        "PROCESS",
+        "QUICK_VETO_TIME",
+        "RAMP_STOP",
+        "RELOCK_DELAY",
+        "SCENE",  # ro"
+        "SELF_CALIBRATION",
+        "SERVICE_COUNT",  # ro"
+        "SET_SYMBOL_FOR_HEATING_PHASE",
+        "SHADING_SPEED",  # ro
+        "SHEV_POS",  # ro"
+        "SMOKE_DETECTOR_COMMAND",  # ro
+        "SPEED",  # ro"
+        "STATE_UNCERTAIN",
+        "SUBMIT",
+        "SWITCH_POINT_OCCURED",
+        "TEMPERATURE_LIMITER",
+        "TEMPERATURE_OUT_OF_RANGE",
+        "TEXT",
+        "TIME_OF_OPERATION",
+        "USER_COLOR",  # ro"
+        "USER_PROGRAM",  # ro"
+        "VALVE_ADAPTION",
+        "WINDOW",  # ro
+        "WIN_RELEASE",
+        "WIN_RELEASE_ACT",  # ro"
+    }
 )
 
 # Ignore Parameter that end with
@@ -253,7 +256,11 @@ class ParameterVisibilityCache:
         """Init the parameter visibility cache."""
         self._central: Final[hmcu.CentralUnit] = central
         self._storage_folder: Final[str] = central.config.storage_folder
-        self._required_parameters: Final[tuple[str, ...]] = get_required_parameters()
+        self._required_parameters: Final[frozenset[str]] = frozenset(get_required_parameters())
+        # ignored parameters, that are not required by custom entities
+        self._ignored_parameters: Final[frozenset[str]] = (
+            _IGNORED_PARAMETERS - self._required_parameters
+        )
         self._raw_un_ignore_list: Final[set[str]] = set(central.config.un_ignore_list or set())
         # paramset_key, parameter
         self._un_ignore_parameters_general: dict[str, set[str]] = {
@@ -354,12 +361,14 @@ class ParameterVisibilityCache:
                 return False
 
             if (
-                (
-                    parameter in _IGNORED_PARAMETERS
-                    or parameter.endswith(tuple(_IGNORED_PARAMETERS_WILDCARDS_END))
-                    or parameter.startswith(tuple(_IGNORED_PARAMETERS_WILDCARDS_START))
+                parameter in self._ignored_parameters
+                or (
+                    (
+                        parameter.endswith(_IGNORED_PARAMETERS_WILDCARDS_END)
+                        or parameter.startswith(_IGNORED_PARAMETERS_WILDCARDS_START)
+                    )
+                    and parameter not in self._required_parameters
                 )
-                and parameter not in self._required_parameters
             ) or element_matches_key(
                 search_elements=self._ignore_parameters_by_device_lower.get(parameter, []),
                 compare_with=device_type_l,
@@ -602,8 +611,8 @@ def check_ignore_parameters_is_clean() -> bool:
     for parameter in get_required_parameters():
         if (
             parameter in _IGNORED_PARAMETERS
-            or parameter.endswith(tuple(_IGNORED_PARAMETERS_WILDCARDS_END))
-            or parameter.startswith(tuple(_IGNORED_PARAMETERS_WILDCARDS_START))
+            or parameter.endswith(_IGNORED_PARAMETERS_WILDCARDS_END)
+            or parameter.startswith(_IGNORED_PARAMETERS_WILDCARDS_START)
         ):
             should_not_be_ignored.append(parameter)
     return len(should_not_be_ignored) == 0
@@ -7,6 +7,7 @@ with the CCU or Homegear.
 from __future__ import annotations
 
 import logging
+import sys
 import threading
 from typing import Any, Final
 from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
@@ -38,7 +39,9 @@ class RPCFunctions:
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
         if central := self._xml_rpc_server.get_central(interface_id):
-            central.event(interface_id, channel_address, parameter, value)
+            # Parameter names are a small set of identifiers.
+            # Interning them makes the subscription lookups in central an identity compare.
+            central.event(interface_id, channel_address, sys.intern(parameter), value)
 
     @callback_system_event(HH_EVENT_ERROR)
     def error(self, interface_id: str, error_code: str, msg: str) -> None:
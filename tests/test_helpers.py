@@ -39,6 +39,7 @@ from hahomematic.helpers import (
     get_event_name,
     get_tls_context,
     get_value_from_dict_by_wildcard_key,
+    get_value_index,
     parse_sys_var,
     to_bool,
     updated_within_seconds,
@@ -327,6 +328,19 @@ async def test_convert_value() -> None:
     assert convert_value(value=True, target_type=TYPE_ACTION, value_list=None) is True
 
 
+@pytest.mark.asyncio
+async def test_get_value_index() -> None:
+    """Test get_value_index."""
+    assert get_value_index(value_list=()) == {}
+    assert get_value_index(value_list=("CLOSED", "OPEN")) == {"CLOSED": 0, "OPEN": 1}
+    assert get_value_index(value_list=("A", "B", "A")) == {"A": 0, "B": 1}
+    assert get_value_index(value_list=("CLOSED", "OPEN")) is get_value_index(
+        value_list=("CLOSED", "OPEN")
+    )
+    with pytest.raises(TypeError):
+        get_value_index(value_list=("CLOSED", "OPEN"))["UNKNOWN"] = 2  # type: ignore[index]
+
+
 @pytest.mark.asyncio
 async def test_element_matches_key() -> None:
     """Test element_matches_key."""
@@ -170,7 +170,7 @@ async def test_cecolordimmereffect(
     assert light.supports_hs_color is True
     assert light.supports_transition is True
     assert light.effect is None
-    assert light.effect_list == [
+    assert light.effect_list == (
         "Off",
         "Slow color change",
         "Medium color change",
@@ -178,7 +178,7 @@ async def test_cecolordimmereffect(
         "Campfire",
         "Waterfall",
         "TV simulation",
-    ]
+    )
 
     assert light.brightness == 0
     await light.turn_on()
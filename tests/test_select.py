@@ -47,6 +47,10 @@ async def test_hmselect(
     # do not write. value above max
     assert select.value == "CLOSED"
 
+    await select.send_value("UNKNOWN")
+    # do not write. value not in value_list
+    assert select.value == "CLOSED"
+
     await select.send_value(1)
     assert mock_client.method_calls[-1] == call.set_value(
         channel_address="VCU6354483:1",
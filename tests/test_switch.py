@@ -77,25 +77,74 @@ async def test_hmswitch(
     )
     assert switch.value is False
     await switch.turn_on(**{"on_time": 60})
-    assert mock_client.method_calls[-2] == call.set_value(
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU2128127:4", paramset_key="VALUES", value={"ON_TIME": 60.0, "STATE": True}
+    )
+    assert switch.value is True
+    await switch.set_on_time_value(35.4)
+    assert mock_client.method_calls[-1] == call.set_value(
         channel_address="VCU2128127:4",
         paramset_key="VALUES",
         parameter="ON_TIME",
-        value=60.0,
+        value=35.4,
     )
+
+
+@pytest.mark.asyncio
+async def test_hmswitch_master(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test HmSwitch on the MASTER paramset."""
+    central, mock_client = await central_local_factory.get_default_central(
+        {"VCU3609622": "HmIP-eTRV-2.json"},
+        un_ignore_list=["GLOBAL_BUTTON_LOCK@HmIP-eTRV-2:0:MASTER"],
+    )
+    switch: HmSwitch = cast(
+        HmSwitch, await helper.get_generic_entity(central, "VCU3609622:0", "GLOBAL_BUTTON_LOCK")
+    )
+    assert switch.paramset_key == "MASTER"
+
+    await switch.turn_on()
     assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU2128127:4",
-        paramset_key="VALUES",
-        parameter="STATE",
+        channel_address="VCU3609622:0",
+        paramset_key="MASTER",
+        parameter="GLOBAL_BUTTON_LOCK",
         value=True,
     )
-    assert switch.value is True
-    await switch.set_on_time_value(35.4)
+    await switch.turn_off()
     assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU2128127:4",
+        channel_address="VCU3609622:0",
+        paramset_key="MASTER",
+        parameter="GLOBAL_BUTTON_LOCK",
+        value=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_hmswitch_without_on_time(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test HmSwitch on a channel without ON_TIME."""
+    central, mock_client = await central_local_factory.get_default_central(
+        {"VCU3609622": "HmIP-eTRV-2.json"},
+        un_ignore_list=["VALVE_ADAPTION"],
+    )
+    switch: HmSwitch = cast(
+        HmSwitch, await helper.get_generic_entity(central, "VCU3609622:1", "VALVE_ADAPTION")
+    )
+
+    await switch.turn_on(**{"on_time": 60})
+    assert mock_client.method_calls[-2] == call.set_value(
+        channel_address="VCU3609622:1",
         paramset_key="VALUES",
         parameter="ON_TIME",
-        value=35.4,
+        value=60.0,
+    )
+    assert mock_client.method_calls[-1] == call.set_value(
+        channel_address="VCU3609622:1",
+        paramset_key="VALUES",
+        parameter="VALVE_ADAPTION",
+        value=True,
     )
 
 